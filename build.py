@@ -0,0 +1,45 @@
+"""
+Build script for the optional Cython extension.
+
+Poetry runs build(setup_kwargs) when building a wheel. The linter works without
+the extension, so a missing Cython or compiler only skips it.
+"""
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+
+class OptionalBuildExt(build_ext):
+    """Compile extensions when possible; the pure-Python fallbacks cover failures."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as error:  # any build failure is non-fatal
+            print(f"Skipping optional C extensions: {error}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as error:  # any build failure is non-fatal
+            print(f"Skipping optional extension {ext.name}: {error}")
+
+
+def build(setup_kwargs):
+    """Add the Cython bracket matcher to the package when Cython is available."""
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return
+    setup_kwargs.update(
+        ext_modules=cythonize(
+            [
+                Extension(
+                    "grokking_algorithms.stacks._linter_c",
+                    ["src/grokking_algorithms/stacks/_linter_c.pyx"],
+                )
+            ],
+            language_level=3,
+        ),
+        cmdclass={"build_ext": OptionalBuildExt},
+    )
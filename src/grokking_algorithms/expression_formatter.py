@@ -1,25 +1,65 @@
+import math
+import operator
 import re
-from abc import ABC, abstractmethod
+import string
+import sys
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is optional
+    numba = None
 
 # --- Expression Base Classes ---
 
 
-class Expression(ABC):
+class Expression:
     """
-    Abstract base class for all expression nodes in the expression tree.
-    All subclasses must implement the format method, which returns a string representation of the expression.
+    Base class for all expression nodes in the expression tree.
+    All subclasses must implement the _format_into method, which appends the string
+    fragments of the expression to an output list; format joins them once.
+    Nodes declare __slots__, so they carry no per-instance __dict__.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def format(self, parent_prec=0):
         """
         Format the expression as a string, adding parentheses as needed based on operator precedence.
+        The tree is walked with an explicit work stack, so deeply nested expressions do not
+        recurse through Python frames.
         Args:
             parent_prec (int): The precedence of the parent operator.
         Returns:
             str: The formatted string representation of the expression.
         """
-        pass
+        out = []
+        # Work stack of pending fragments (str) and (node, parent_prec) pairs
+        pending = [(self, parent_prec)]
+        while pending:
+            item = pending.pop()
+            if type(item) is str:
+                out.append(item)
+            else:
+                node, prec = item
+                node._format_into(out, pending, prec)
+        return "".join(out)
+
+    def _format_into(self, out, pending, parent_prec):
+        """
+        Append the leading string fragments of the formatted expression to out, and push
+        the rest (fragments and child nodes) onto pending in reverse order.
+        Args:
+            out (list[str]): The output buffer.
+            pending (list): The work stack of format.
+            parent_prec (int): The precedence of the parent operator.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement _format_into")
 
 
 class Value(Expression):
@@ -27,6 +67,8 @@ class Value(Expression):
     Represents a literal value (number) in the expression.
     """
 
+    __slots__ = ("val",)
+
     def __init__(self, val):
         """
         Args:
@@ -34,11 +76,11 @@ class Value(Expression):
         """
         self.val = val
 
-    def format(self, parent_prec=0):
+    def _format_into(self, out, pending, parent_prec):
         """
-        Returns the string representation of the value.
+        Appends the string representation of the value.
         """
-        return str(self.val)
+        out.append(str(self.val))
 
 
 class Variable(Expression):
@@ -46,6 +88,8 @@ class Variable(Expression):
     Represents a variable (identifier) in the expression.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         """
         Args:
@@ -53,11 +97,11 @@ class Variable(Expression):
         """
         self.name = name
 
-    def format(self, parent_prec=0):
+    def _format_into(self, out, pending, parent_prec):
         """
-        Returns the variable name as a string.
+        Appends the variable name.
         """
-        return self.name
+        out.append(self.name)
 
 
 class UnaryOp(Expression):
@@ -65,6 +109,8 @@ class UnaryOp(Expression):
     Represents a unary operation (e.g., -a, abs(a)) in the expression.
     """
 
+    __slots__ = ("op", "operand")
+
     def __init__(self, op, operand):
         """
         Args:
@@ -74,13 +120,16 @@ class UnaryOp(Expression):
         self.op = op
         self.operand = operand
 
-    def format(self, parent_prec=0):
+    def _format_into(self, out, pending, parent_prec):
         """
-        Formats the unary operation as a string, e.g., '-(a)' or 'abs(a)'.
+        Appends the unary operation, e.g., '-(a)' or 'abs(a)'.
         """
         # Unary operators like - and functions like abs(), round()
         # Always format as op(expr), with parentheses after operator for clarity
-        return f"{self.op}({self.operand.format()})"
+        out.append(self.op)
+        out.append("(")
+        pending.append(")")
+        pending.append((self.operand, 0))
 
 
 class BinaryOp(Expression):
@@ -89,6 +138,8 @@ class BinaryOp(Expression):
     Handles operator precedence and associativity for correct parenthesization.
     """
 
+    __slots__ = ("left", "op", "right")
+
     def __init__(self, left, op, right):
         """
         Args:
@@ -100,47 +151,100 @@ class BinaryOp(Expression):
         self.op = op
         self.right = right
 
-    def format(self, parent_prec=0):
-        """
-        Formats the binary operation as a string, adding parentheses as needed based on precedence.
-        """
-        op_prec, assoc = OperatorMeta.get(self.op)
-
-        # Helper function to decide if child should be parenthesized
-        def must_parenthesize(child, child_side):
-            if isinstance(child, BinaryOp):
-                child_prec, _ = OperatorMeta.get(child.op)
-                # Parenthesize if child's precedence is greater than current op
-                if child_prec > op_prec:
+    @staticmethod
+    def _must_parenthesize(child, child_side, op_prec, assoc):
+        """
+        Decides if a child of an operator with the given precedence and associativity
+        should be parenthesized.
+        """
+        if isinstance(child, BinaryOp):
+            child_meta = _op_get(child.op)
+            if child_meta is None:
+                raise ValueError(f"Unknown operator: {child.op}")
+            child_prec = child_meta[0]
+            # Parenthesize if child's precedence is greater than current op
+            if child_prec > op_prec:
+                return True
+            # If same precedence and it conflicts with associativity, parenthesize
+            if child_prec == op_prec:
+                if (assoc == "L" and child_side == "right") or (
+                    assoc == "R" and child_side == "left"
+                ):
                     return True
-                # If same precedence and it conflicts with associativity, parenthesize
-                if child_prec == op_prec:
-                    if (assoc == "L" and child_side == "right") or (
-                        assoc == "R" and child_side == "left"
-                    ):
-                        return True
-            # Parenthesize for UnaryOp if appropriate (usually not necessary)
-            return False
+        # Parenthesize for UnaryOp if appropriate (usually not necessary)
+        return False
+
+    def _format_into(self, out, pending, parent_prec):
+        """
+        Appends the binary operation, adding parentheses as needed based on precedence.
+        The right operand is pushed as a continuation and the left operand is formatted next.
+        """
+        meta = _op_get(self.op)
+        if meta is None:
+            raise ValueError(f"Unknown operator: {self.op}")
+        op_prec, assoc = meta
+
+        left = self.left
+        right = self.right
+        if type(left) is not BinaryOp and type(right) is not BinaryOp:
+            # Fast path: non-BinaryOp operands are never parenthesized and ignore the
+            # precedence context, so only the wrap against the parent remains.
+            if op_prec < parent_prec:
+                out.append("(")
+                pending.append(")")
+            pending.append((right, 0))
+            pending.append(f" {self.op} ")
+            left._format_into(out, pending, 0)
+            return
+
+        left_paren = self._must_parenthesize(left, "left", op_prec, assoc)
+        right_paren = self._must_parenthesize(right, "right", op_prec, assoc)
+
+        # Parenthesize if current op precedence is less than parent precedence
+        if op_prec < parent_prec:
+            out.append("(")
+            pending.append(")")
 
         # Format left and right sub-expressions with adjusted precedence context
         # +1 or same precedence depending on associativity, to manage chains properly
-        left_fmt = self.left.format(op_prec if assoc == "L" else op_prec + 1)
-        right_fmt = self.right.format(op_prec + 1 if assoc == "L" else op_prec)
+        if right_paren:
+            pending.append(")")
+        pending.append((right, op_prec + 1 if assoc == "L" else op_prec))
+        if right_paren:
+            pending.append("(")
+        pending.append(f" {self.op} ")
+        if left_paren:
+            out.append("(")
+            pending.append(")")
+        pending.append((left, op_prec if assoc == "L" else op_prec + 1))
 
-        if must_parenthesize(self.left, "left"):
-            left_fmt = f"({left_fmt})"
-        if must_parenthesize(self.right, "right"):
-            right_fmt = f"({right_fmt})"
 
-        expr_str = f"{left_fmt} {self.op} {right_fmt}"
-
-        # Parenthesize if current op precedence is less than parent precedence
-        if op_prec < parent_prec:
-            return f"({expr_str})"
-        return expr_str
+# --- Operator Metadata ---
 
 
-# --- Operator Metadata ---
+# Map operator -> (precedence, associativity). Hot paths call _op_get directly:
+# a single probe that returns None for unsupported operators.
+_OP_TABLE = {
+    "or": (1, "L"),
+    "and": (2, "L"),
+    "not": (3, "R"),  # if you support unary not
+    "==": (4, "L"),
+    "!=": (4, "L"),
+    "<": (5, "L"),
+    ">": (5, "L"),
+    "<=": (5, "L"),
+    ">=": (5, "L"),
+    "+": (5, "L"),
+    "-": (5, "L"),
+    "*": (6, "L"),
+    "/": (6, "L"),
+    "%": (6, "L"),
+    "**": (7, "R"),  # exponentiation is right-associative
+}
+# Intern the operator strings; tokenize hands out the same objects, so table
+# lookups on token values succeed on the identity check without comparing text.
+_OP_TABLE = {sys.intern(op): meta for op, meta in _OP_TABLE.items()}
+_op_get = _OP_TABLE.get
 
 
 class OperatorMeta:
@@ -149,27 +253,10 @@ class OperatorMeta:
     Provides methods to query operator properties.
     """
 
-    # Map operator -> (precedence, associativity)
-    OPERATORS = {
-        "or": (1, "L"),
-        "and": (2, "L"),
-        "not": (3, "R"),  # if you support unary not
-        "==": (4, "L"),
-        "!=": (4, "L"),
-        "<": (5, "L"),
-        ">": (5, "L"),
-        "<=": (5, "L"),
-        ">=": (5, "L"),
-        "+": (5, "L"),
-        "-": (5, "L"),
-        "*": (6, "L"),
-        "/": (6, "L"),
-        "%": (6, "L"),
-        "**": (7, "R"),  # exponentiation is right-associative
-    }
-
-    @classmethod
-    def get(cls, op):
+    OPERATORS = _OP_TABLE
+
+    @staticmethod
+    def get(op):
         """
         Returns the precedence and associativity for the given operator.
         Args:
@@ -179,12 +266,13 @@ class OperatorMeta:
         Raises:
             ValueError: If the operator is not supported.
         """
-        if op not in cls.OPERATORS:
+        meta = OperatorMeta.OPERATORS.get(op)
+        if meta is None:
             raise ValueError(f"Unknown operator: {op}")
-        return cls.OPERATORS[op]
+        return meta
 
-    @classmethod
-    def contains(cls, op):
+    @staticmethod
+    def contains(op):
         """
         Checks if the operator is supported.
         Args:
@@ -192,12 +280,15 @@ class OperatorMeta:
         Returns:
             bool: True if supported, False otherwise.
         """
-        return op in cls.OPERATORS
+        return op in OperatorMeta.OPERATORS
 
 
 # --- Tokenizer ---
 
 
+# Order matters: alternatives are tried first to last, so OP must precede ID
+# (keyword operators) and UNKNOWN must stay last. tokenize scans by hand and
+# mirrors these patterns; keep both in sync when editing the spec.
 TOKEN_SPEC = [
     ("SKIP", r"[ \t]+"),
     ("OP", r"\b(?:and|or|not|is|in)\b|==|!=|<=|>=|\*\*|[+\-*/%<>=()]"),
@@ -208,9 +299,29 @@ TOKEN_SPEC = [
 ]
 
 
+# Master regex, only consulted by tokenize for keyword operators whose word
+# boundaries depend on the surrounding characters.
+_MASTER_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPEC)
+)
+
+_KEYWORD_OPS = frozenset(("and", "or", "not", "is", "in"))
+# Maps each two-character operator to its interned string
+_TWO_CHAR_OPS = {op: sys.intern(op) for op in ("==", "!=", "<=", ">=", "**")}
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Token kind keyed on the first character of the token. Newlines match no
+# TOKEN_SPEC pattern (not even UNKNOWN's "."), so they are skipped silently.
+_FIRST_CHAR_KIND = {" ": "SKIP", "\t": "SKIP", "\n": "SKIP", ",": "COMMA", "!": "OP"}
+_FIRST_CHAR_KIND.update(dict.fromkeys("+-*/%<>=()", "OP"))
+_FIRST_CHAR_KIND.update(dict.fromkeys(string.digits, "NUMBER"))
+_FIRST_CHAR_KIND.update(dict.fromkeys(string.ascii_letters + "_", "ID"))
+
+
 def tokenize(expression):
     """
     Tokenizes the input expression string into a sequence of (kind, value) pairs.
+    Scans the string with an index cursor instead of matching TOKEN_SPEC per token.
     Args:
         expression (str): The input expression string.
     Yields:
@@ -218,20 +329,67 @@ def tokenize(expression):
     Raises:
         SyntaxError: If an unknown character is encountered.
     """
-    regex = "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPEC)
-    for match in re.finditer(regex, expression):
-        kind = match.lastgroup
-        value = match.group()
+    pos = 0
+    end = len(expression)
+    while pos < end:
+        char = expression[pos]
+        kind = _FIRST_CHAR_KIND.get(char)
+        if kind is None and char.isdecimal():
+            # \d also matches non-ASCII decimal digits
+            kind = "NUMBER"
+
         if kind == "SKIP":
-            continue
-        elif kind == "UNKNOWN":
-            raise SyntaxError(f"Unexpected character: {value}")
-        yield (kind, value)
+            pos += 1
+            while pos < end and expression[pos] in " \t":
+                pos += 1
+        elif kind == "ID":
+            start = pos
+            pos += 1
+            while pos < end and expression[pos] in _ID_CHARS:
+                pos += 1
+            value = expression[start:pos]
+            if value in _KEYWORD_OPS:
+                # Keyword operators need \b on both sides; let the regex decide
+                match = _MASTER_RE.match(expression, start)
+                value = sys.intern(match.group())
+                pos = start + len(value)
+                yield (match.lastgroup, value)
+            else:
+                yield ("ID", value)
+        elif kind == "NUMBER":
+            start = pos
+            pos += 1
+            while pos < end and expression[pos].isdecimal():
+                pos += 1
+            if pos < end and expression[pos] == ".":
+                pos += 1
+                while pos < end and expression[pos].isdecimal():
+                    pos += 1
+            yield ("NUMBER", expression[start:pos])
+        elif kind == "OP":
+            op = _TWO_CHAR_OPS.get(expression[pos : pos + 2])
+            if op is not None:
+                pos += 2
+                yield ("OP", op)
+            elif char == "!":
+                raise SyntaxError(f"Unexpected character: {char}")
+            else:
+                # One-character strings are already shared singletons in CPython
+                pos += 1
+                yield ("OP", char)
+        elif kind == "COMMA":
+            pos += 1
+            yield ("COMMA", char)
+        else:
+            raise SyntaxError(f"Unexpected character: {char}")
 
 
 # --- Parser ---
 
 
+_EOF = ("EOF", "")
+
+
 class Parser:
     """
     Parses a tokenized expression string into an expression tree (AST).
@@ -240,25 +398,25 @@ class Parser:
 
     def __init__(self, expression):
         """
+        Tokens are pulled from tokenize one at a time; the parser only ever needs the
+        current token, so the token stream is never materialized.
         Args:
             expression (str): The input expression string.
         """
-        self.tokens = list(tokenize(expression))
-        self.pos = 0
+        self._token_iter = tokenize(expression)
+        self._cur = next(self._token_iter, _EOF)
 
     def current(self):
         """
         Returns the current token as a (kind, value) tuple.
         """
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return ("EOF", "")
+        return self._cur
 
     def advance(self):
         """
         Advances to the next token.
         """
-        self.pos += 1
+        self._cur = next(self._token_iter, _EOF)
 
     def expect(self, kind, value=None):
         """
@@ -283,28 +441,34 @@ class Parser:
     def parse_expression(self, min_prec=1):
         """
         Parses an expression with respect to operator precedence.
+        Operator chains are handled with an explicit stack of operators still waiting for
+        their right operand, instead of recursing once per operator.
         Args:
             min_prec (int): The minimum precedence to consider.
         Returns:
             Expression: The parsed expression node.
         """
+        # Each entry is (left operand, operator, min_prec to restore once it is reduced)
+        waiting = []
         node = self.parse_primary()
 
         while True:
             tok_kind, tok_val = self.current()
 
-            # Only parse operators defined in OperatorMeta
-            if tok_kind == "OP" and OperatorMeta.contains(tok_val):
-                prec, assoc = OperatorMeta.get(tok_val)
-                if prec < min_prec:
-                    break
+            # Only parse operators defined in the operator table
+            meta = _op_get(tok_val) if tok_kind == "OP" else None
+            if meta is not None and meta[0] >= min_prec:
+                prec, assoc = meta
                 self.advance()
-                next_min_prec = prec + 1 if assoc == "L" else prec
-                right = self.parse_expression(next_min_prec)
-                node = BinaryOp(node, tok_val, right)
+                waiting.append((node, tok_val, min_prec))
+                min_prec = prec + 1 if assoc == "L" else prec
+                node = self.parse_primary()
+            elif waiting:
+                # The right operand is complete; reduce and retry the same token
+                left, op, min_prec = waiting.pop()
+                node = BinaryOp(left, op, node)
             else:
-                break
-        return node
+                return node
 
     def parse_primary(self):
         """
@@ -364,6 +528,8 @@ class FuncCall(Expression):
     Represents a function call with multiple arguments (e.g., round(a + b, 2)).
     """
 
+    __slots__ = ("name", "args")
+
     def __init__(self, name, args):
         """
         Args:
@@ -373,21 +539,329 @@ class FuncCall(Expression):
         self.name = name
         self.args = args
 
-    def format(self, parent_prec=0):
-        """
-        Formats the function call as a string, e.g., 'round(a + b, 2)'.
-        """
-        args_str = ", ".join(arg.format() for arg in self.args)
-        return f"{self.name}({args_str})"
+    def _format_into(self, out, pending, parent_prec):
+        """
+        Appends the function call, e.g., 'round(a + b, 2)'.
+        """
+        out.append(self.name)
+        out.append("(")
+        pending.append(")")
+        for index in range(len(self.args) - 1, -1, -1):
+            pending.append((self.args[index], 0))
+            if index:
+                pending.append(", ")
+
+
+# --- Bytecode Evaluation ---
+
+# Opcodes of the stack machine run by evaluate. PUSH_CONST and PUSH_VAR are
+# followed by an operand slot holding an index into consts or var_values.
+_PUSH_CONST = 0
+_PUSH_VAR = 1
+_NEG = 2
+_ABS = 3
+_ROUND = 4
+_ROUND_NDIGITS = 5
+_ADD = 6
+_SUB = 7
+_MUL = 8
+_DIV = 9
+_MOD = 10
+_POW = 11
+_EQ = 12
+_NE = 13
+_LT = 14
+_GT = 15
+_LE = 16
+_GE = 17
+_AND = 18
+_OR = 19
+
+_UNARY_OPCODES = {"-": _NEG, "abs": _ABS, "round": _ROUND}
+_FUNC_OPCODES = {("round", 2): _ROUND_NDIGITS}
+_BINARY_OPCODES = {
+    "+": _ADD,
+    "-": _SUB,
+    "*": _MUL,
+    "/": _DIV,
+    "%": _MOD,
+    "**": _POW,
+    "==": _EQ,
+    "!=": _NE,
+    "<": _LT,
+    ">": _GT,
+    "<=": _LE,
+    ">=": _GE,
+    "and": _AND,
+    "or": _OR,
+}
+
+
+def compile_to_bytecode(expression):
+    """
+    Lowers an expression tree into a flat program for the evaluate stack machine.
+    Nodes are emitted in postorder; all values are treated as floats.
+    Args:
+        expression (Expression): The root of the expression tree.
+    Returns:
+        tuple: (ops, consts, names) where ops holds opcodes and their operands, consts the
+        literal values, and names the variable names in the order evaluate expects their
+        values. ops and consts are NumPy arrays when NumPy is installed, lists otherwise.
+    Raises:
+        ValueError: If the tree uses an operator or function the stack machine lacks.
+    """
+    ops = []
+    consts = []
+    names = {}
+    # Work stack of nodes to lower and opcodes to emit once their operands are done
+    pending = [expression]
+    while pending:
+        item = pending.pop()
+        if type(item) is int:
+            ops.append(item)
+        elif isinstance(item, Value):
+            ops.append(_PUSH_CONST)
+            ops.append(len(consts))
+            consts.append(float(item.val))
+        elif isinstance(item, Variable):
+            ops.append(_PUSH_VAR)
+            ops.append(names.setdefault(item.name, len(names)))
+        elif isinstance(item, UnaryOp):
+            opcode = _UNARY_OPCODES.get(item.op)
+            if opcode is None:
+                raise ValueError(f"Cannot compile unary operation: {item.op}")
+            pending.append(opcode)
+            pending.append(item.operand)
+        elif isinstance(item, BinaryOp):
+            opcode = _BINARY_OPCODES.get(item.op)
+            if opcode is None:
+                raise ValueError(f"Cannot compile binary operator: {item.op}")
+            pending.append(opcode)
+            pending.append(item.right)
+            pending.append(item.left)
+        elif isinstance(item, FuncCall):
+            opcode = _FUNC_OPCODES.get((item.name, len(item.args)))
+            if opcode is None:
+                raise ValueError(f"Cannot compile function call: {item.name}")
+            pending.append(opcode)
+            pending.extend(reversed(item.args))
+        else:
+            raise ValueError(f"Cannot compile expression node: {item!r}")
+
+    if np is not None:
+        ops = np.array(ops, dtype=np.int64)
+        consts = np.array(consts, dtype=np.float64)
+    return ops, consts, tuple(names)
+
+
+def _pow(a, b):
+    """
+    Raises a to the power b with IEEE 754 results, like the float64 stack machine:
+    nan for a negative base with a fractional exponent, and an infinity for a zero base
+    with a negative exponent or on overflow.
+    """
+    try:
+        result = a**b
+    except (ZeroDivisionError, OverflowError):
+        # The infinity is negative only for a negative base with an odd integer exponent
+        odd = b.is_integer() and b % 2 == 1
+        return -math.inf if odd and math.copysign(1.0, a) < 0 else math.inf
+    if type(result) is complex:
+        return math.nan
+    return result
+
+
+def _round_ndigits(a, b):
+    """
+    Rounds a to b decimal digits; nan and infinities pass through unchanged.
+    """
+    if not math.isfinite(b):
+        raise ValueError("round() ndigits must be finite")
+    return float(round(a, int(b)))
+
+
+_UNARY_FUNCS = {
+    _NEG: operator.neg,
+    _ABS: abs,
+    # round(a, 0) stays a float, so nan, infinities and huge values pass through
+    _ROUND: lambda a: round(a, 0),
+}
+_BINARY_FUNCS = {
+    _ROUND_NDIGITS: _round_ndigits,
+    _ADD: operator.add,
+    _SUB: operator.sub,
+    _MUL: operator.mul,
+    _DIV: operator.truediv,
+    _MOD: operator.mod,
+    _POW: _pow,
+    _EQ: lambda a, b: float(a == b),
+    _NE: lambda a, b: float(a != b),
+    _LT: lambda a, b: float(a < b),
+    _GT: lambda a, b: float(a > b),
+    _LE: lambda a, b: float(a <= b),
+    _GE: lambda a, b: float(a >= b),
+    _AND: lambda a, b: b if a else a,
+    _OR: lambda a, b: a if a else b,
+}
+
+
+def _evaluate_dispatch(ops, consts, var_values):
+    """
+    Runs a compiled program with a dispatch table of Python callables.
+    Used when Numba is not installed.
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    pc = 0
+    end = len(ops)
+    while pc < end:
+        opcode = ops[pc]
+        if opcode == _PUSH_CONST:
+            push(float(consts[ops[pc + 1]]))
+            pc += 2
+        elif opcode == _PUSH_VAR:
+            push(float(var_values[ops[pc + 1]]))
+            pc += 2
+        elif opcode in _UNARY_FUNCS:
+            push(_UNARY_FUNCS[opcode](pop()))
+            pc += 1
+        else:
+            func = _BINARY_FUNCS.get(opcode)
+            if func is None:
+                raise ValueError("Unknown opcode")
+            right = pop()
+            push(func(pop(), right))
+            pc += 1
+    return stack[0]
+
+
+def _evaluate_stack_machine(ops, consts, var_values):
+    """
+    Runs a compiled program on a preallocated float64 stack.
+    Written for numba.njit; only used when Numba is installed.
+    """
+    stack = np.empty(len(ops), dtype=np.float64)
+    sp = 0
+    pc = 0
+    end = len(ops)
+    while pc < end:
+        opcode = ops[pc]
+        if opcode == _PUSH_CONST:
+            stack[sp] = consts[ops[pc + 1]]
+            sp += 1
+            pc += 2
+            continue
+        if opcode == _PUSH_VAR:
+            stack[sp] = var_values[ops[pc + 1]]
+            sp += 1
+            pc += 2
+            continue
+        pc += 1
+        if opcode == _NEG:
+            stack[sp - 1] = -stack[sp - 1]
+            continue
+        if opcode == _ABS:
+            stack[sp - 1] = abs(stack[sp - 1])
+            continue
+        if opcode == _ROUND:
+            # round(x) would go through int64; round(x, 0) stays a float
+            stack[sp - 1] = round(stack[sp - 1], 0)
+            continue
+        sp -= 1
+        a = stack[sp - 1]
+        b = stack[sp]
+        if opcode == _ROUND_NDIGITS:
+            if not math.isfinite(b):
+                raise ValueError("round() ndigits must be finite")
+            result = round(a, int(b))
+        elif opcode == _ADD:
+            result = a + b
+        elif opcode == _SUB:
+            result = a - b
+        elif opcode == _MUL:
+            result = a * b
+        elif opcode == _DIV:
+            result = a / b
+        elif opcode == _MOD:
+            result = a % b
+        elif opcode == _POW:
+            result = a**b
+        elif opcode == _EQ:
+            result = 1.0 if a == b else 0.0
+        elif opcode == _NE:
+            result = 1.0 if a != b else 0.0
+        elif opcode == _LT:
+            result = 1.0 if a < b else 0.0
+        elif opcode == _GT:
+            result = 1.0 if a > b else 0.0
+        elif opcode == _LE:
+            result = 1.0 if a <= b else 0.0
+        elif opcode == _GE:
+            result = 1.0 if a >= b else 0.0
+        elif opcode == _AND:
+            result = b if a != 0.0 else a
+        elif opcode == _OR:
+            result = a if a != 0.0 else b
+        else:
+            raise ValueError("Unknown opcode")
+        stack[sp - 1] = result
+    return stack[0]
+
+
+if numba is not None:
+    _evaluate_impl = numba.njit(cache=True)(_evaluate_stack_machine)
+else:
+    _evaluate_impl = _evaluate_dispatch
+
+
+def evaluate(ops, consts, var_values):
+    """
+    Evaluates a program produced by compile_to_bytecode.
+    Compiled with Numba when it is installed, otherwise run by a pure-Python dispatch loop.
+    Args:
+        ops: Opcodes and operands from compile_to_bytecode.
+        consts: Literal values from compile_to_bytecode.
+        var_values: Variable values, ordered like the names from compile_to_bytecode.
+            Any sequence of numbers; converted to a float64 array when NumPy is installed.
+    Returns:
+        float: The value of the expression.
+    Raises:
+        ValueError: If ops holds an unknown opcode.
+    """
+    if np is not None:
+        ops = np.asarray(ops, dtype=np.int64)
+        consts = np.asarray(consts, dtype=np.float64)
+        var_values = np.asarray(var_values, dtype=np.float64)
+    return _evaluate_impl(ops, consts, var_values)
 
 
 # --- Main Formatter Class ---
 
 
+@lru_cache(maxsize=1024)
+def _parse_cached(expr_string):
+    """
+    Parses an expression string, reusing the tree from earlier calls with the same string.
+    The returned tree is shared between callers, so nodes must be treated as immutable.
+    """
+    return Parser(expr_string).parse()
+
+
+@lru_cache(maxsize=1024)
+def _format_cached(expression):
+    """
+    Formats an expression tree, reusing the string from earlier calls with the same tree.
+    """
+    return expression.format(parent_prec=0)
+
+
 class ExpressionFormatter:
     """
     Main class for formatting expressions.
     Parses the input string and provides a formatted string representation with correct parentheses.
+    Parsed trees and their formatted output are cached per input string; the nodes in
+    `expression` are shared between formatters and must not be mutated.
     """
 
     def __init__(self, expr_string):
@@ -396,13 +870,21 @@ class ExpressionFormatter:
             expr_string (str): The input expression string.
         """
         self.expr_string = expr_string
-        self.expression = Parser(expr_string).parse()
+        self.expression = _parse_cached(expr_string)
 
     def format(self):
         """
         Returns the formatted string representation of the parsed expression.
         """
-        return self.expression.format(parent_prec=0)
+        return _format_cached(self.expression)
+
+    def compile_to_bytecode(self):
+        """
+        Lowers the parsed expression into a flat program for evaluate.
+        Returns:
+            tuple: (ops, consts, names); see the module-level compile_to_bytecode.
+        """
+        return compile_to_bytecode(self.expression)
 
 
 # --- For Manual Testing ---
@@ -3,6 +3,8 @@
 import copy
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data, next=None):
         """
         Initialize a new node with data and an optional next node.
@@ -11,53 +13,8 @@ class Node:
             data: The data to store in the node.
             next (Node, optional): The next node in the list. Defaults to None.
         """
-        self._data = data
-        self._next = next       
-
-    @property
-    def data(self):
-        """
-        Get the data stored in the node.
-
-        Returns:
-            The data stored in the node.
-        """
-        return self._data
-    
-    @data.setter
-    def data(self, value):
-        """
-        Set the data stored in the node.
-
-        Args:
-            value: The new data to store.
-        """
-        self._data = value
-
-    @property
-    def next(self):
-        """
-        Get the next node.
-
-        Returns:
-            Node or None: The next node in the list.
-        """
-        return self._next
-    
-    @next.setter
-    def next(self, value):
-        """
-        Set the next node.
-
-        Args:
-            value (Node or None): The node to set as next.
-
-        Raises:
-            TypeError: If value is not a Node or None.
-        """
-        if not isinstance(value, Node) and value is not None:
-            raise TypeError("next must be an instance of Node or None")
-        self._next = value
+        self.data = data
+        self.next = next
 
     def __repr__(self):
         """
@@ -84,7 +41,7 @@ class Node:
         Returns:
             bool: True if there is a next node, False otherwise.
         """
-        return self._next is not None
+        return self.next is not None
     
     def append(self, next_node):
         """
@@ -93,8 +50,7 @@ class Node:
         Args:
             next_node (Node): The node to set as next.
         """
-
-        self._next = next_node
+        self.next = next_node
 
 class SingleLinkedList:
     def __init__(self):
@@ -102,6 +58,8 @@ class SingleLinkedList:
         Initialize an empty single linked list.
         """
         self._head = None
+        self._tail = None
+        self._size = 0
 
     def is_empty(self):
         """
@@ -122,10 +80,8 @@ class SingleLinkedList:
         Yields:
             The result of applying functor to each node's data.
         """
-        current = self._head
-        while current is not None:
-            yield functor(current.data)
-            current = current.next
+        for data in self:
+            yield functor(data)
 
     def __iter__(self):
         """
@@ -134,6 +90,7 @@ class SingleLinkedList:
         Yields:
             The data of each node in the list.
         """
+        # The only node walker; traverse, search and __contains__ iterate through it
         current = self._head
         while current is not None:
             yield current.data
@@ -146,12 +103,7 @@ class SingleLinkedList:
         Returns:
             int: The number of elements in the list.
         """
-        count = 0
-        current = self._head
-        while current is not None:
-            count += 1
-            current = current.next
-        return count
+        return self._size
     
     def size(self):
         """
@@ -172,12 +124,7 @@ class SingleLinkedList:
         Returns:
             The data of the first matching node, or None if not found.
         """
-        current = self._head
-        while current is not None:
-            if predicate(current.data):
-                return current.data
-            current = current.next
-        return None
+        return next((data for data in self if predicate(data)), None)
     
     def __contains__(self, item):
         """
@@ -189,12 +136,7 @@ class SingleLinkedList:
         Returns:
             bool: True if the item is in the list, False otherwise.
         """
-        current = self._head
-        while current is not None:
-            if current.data == item:
-                return True
-            current = current.next
-        return False
+        return any(data == item for data in self)
     
     def __repr__(self):
         """
@@ -221,8 +163,9 @@ class SingleLinkedList:
         Args:
             data: The data to insert.
         """
+        self._size += 1
         if self.is_empty():
-            self._head = Node(data)
+            self._head = self._tail = Node(data)
             return
         
         old_head = self._head
@@ -238,20 +181,21 @@ class SingleLinkedList:
             data: The data to insert.
         """
         new_node = Node(data)
+        self._size += 1
 
         if not self._head:
-            self._head = new_node
+            self._head = self._tail = new_node
             return
         
-        current = self._head
-        while current.has_next():
-            current = current.next
-        current.append(new_node)
+        self._tail.append(new_node)
+        self._tail = new_node
 
     def get(self, index):
         """
         Get the data at a specific index.
 
+        Like indexing a Python list, this returns the stored object itself rather than a copy.
+
         Args:
             index (int): The index of the element to retrieve.
 
@@ -273,7 +217,22 @@ class SingleLinkedList:
         if current is None:
             raise IndexError("Index out of bounds")
         
-        return copy.deepcopy(current.data)
+        return current.data
+
+    def get_copy(self, index):
+        """
+        Get a deep copy of the data at a specific index.
+
+        Args:
+            index (int): The index of the element to retrieve.
+
+        Returns:
+            A deep copy of the data at the specified index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        return copy.deepcopy(self.get(index))
     
     def delete(self, target):
         """
@@ -293,6 +252,9 @@ class SingleLinkedList:
                     self._head = current.next
                 else:
                     previous.append(current.next)
+                if current is self._tail:
+                    self._tail = previous
+                self._size -= 1
                 return
             previous = current
             current = current.next
@@ -312,6 +274,9 @@ class SingleLinkedList:
             raise ValueError("List is empty")
         data = self._head.data
         self._head = self._head.next
+        if self._head is None:
+            self._tail = None
+        self._size -= 1
         return data
 
 
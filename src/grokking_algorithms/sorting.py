@@ -1,18 +1,196 @@
-from typing import Sequence ,TypeVar,Generic 
+import heapq
+from math import log2
+from typing import List, Optional, Sequence ,TypeVar,Generic 
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    from numba import njit
+    from numba.extending import register_jitable
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
 
 
 T = TypeVar('T')
 
+# Ranges shorter than this are finished with insertion sort
+_INSERTION_THRESHOLD = 16
+# Inputs longer than this are handed to the built-in Timsort
+_TIMSORT_THRESHOLD = 64
+# Ranges at least this long pick their pivot with a ninther
+_NINTHER_THRESHOLD = 256
+
+
+def _insertion_sort(a: List[T], lo: int, hi: int) -> None:
+    for i in range(lo + 1, hi + 1):
+        key = a[i]
+        j = i
+        while j > lo and key < a[j - 1]:
+            a[j] = a[j - 1]
+            j -= 1
+        a[j] = key
+
+
+def _heapsort(a: List[T], lo: int, hi: int) -> None:
+    heap = a[lo:hi + 1]
+    heapq.heapify(heap)
+    for i in range(lo, hi + 1):
+        a[i] = heapq.heappop(heap)
+
+
+def _median_of_three(a: List[T], i: int, j: int, k: int) -> int:
+    if a[i] < a[j]:
+        if a[j] < a[k]:
+            return j
+        return k if a[i] < a[k] else i
+    if a[i] < a[k]:
+        return i
+    return k if a[j] < a[k] else j
+
+
+def _pivot(a: List[T], lo: int, hi: int) -> int:
+    # Index of the median of a[lo], a[mid], a[hi]; long ranges use the median
+    # of three such medians (Tukey's ninther)
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < _NINTHER_THRESHOLD:
+        return _median_of_three(a, lo, mid, hi)
+    step = (hi - lo + 1) // 8
+    return _median_of_three(
+        a,
+        _median_of_three(a, lo, lo + step, lo + 2 * step),
+        _median_of_three(a, mid - step, mid, mid + step),
+        _median_of_three(a, hi - 2 * step, hi - step, hi),
+    )
+
+
+def _partition(a: List[T], lo: int, hi: int) -> int:
+    # Hoare partition around the value picked by _pivot, moved to the middle;
+    # returns j such that a[lo..j] <= pivot <= a[j+1..hi], with lo <= j < hi
+    mid = (lo + hi) // 2
+    p = _pivot(a, lo, hi)
+    a[p], a[mid] = a[mid], a[p]
+    pivot = a[mid]
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            return j
+        a[i], a[j] = a[j], a[i]
+
+
+if njit is not None:
+    # The helpers above only index and compare, so Numba compiles them as is
+    register_jitable(_median_of_three)
+    register_jitable(_pivot)
+    _insertion_sort_nb = njit(cache=True)(_insertion_sort)
+    _partition_nb = njit(cache=True)(_partition)
+
+    @njit(cache=True)
+    def _quicksort_nb(a, lo, hi):
+        # Recurse into the smaller side and loop on the larger one
+        while hi - lo >= _INSERTION_THRESHOLD:
+            p = _partition_nb(a, lo, hi)
+            if p - lo < hi - p:
+                _quicksort_nb(a, lo, p)
+                lo = p + 1
+            else:
+                _quicksort_nb(a, p + 1, hi)
+                hi = p
+        _insertion_sort_nb(a, lo, hi)
+
+
+def _numpy_sort(data: Sequence[T]) -> Optional[List[T]]:
+    # NumPy's vectorized sort for 1-D arrays and for long lists of only ints or
+    # only floats; None when the data does not qualify
+    if isinstance(data, np.ndarray):
+        if data.ndim != 1:
+            return None
+        return np.sort(data, kind="quicksort").tolist()
+    if len(data) <= _TIMSORT_THRESHOLD:
+        return None
+    kind = type(data[0])
+    if kind is not int and kind is not float:
+        return None
+    if not all(type(x) is kind for x in data):
+        return None
+    try:
+        array = np.asarray(data, dtype=np.int64 if kind is int else np.float64)
+    except OverflowError:
+        # ints beyond int64 keep Python semantics
+        return None
+    return np.sort(array, kind="quicksort").tolist()
+
+
 class RecursiveQuickSort(Generic[T]):
 
     def __init__(self, data: Sequence[T]) -> None:
         self.data = data
 
-    def sort(self) -> Sequence[T]:
-        if len(self.data) <= 1:
-            return self.data
-        pivot = self.data[len(self.data) // 2]
-        left = [x for x in self.data if x < pivot]
-        middle = [x for x in self.data if x == pivot]
-        right = [x for x in self.data if x > pivot]
-        return RecursiveQuickSort(left).sort() + middle + RecursiveQuickSort(right).sort()
\ No newline at end of file
+    def sort_fast(self) -> List[T]:
+        # CPython's Timsort, implemented in C
+        return sorted(self.data)
+
+    def sort_jit(self) -> List[T]:
+        # Numba-compiled quicksort for 1-D numeric arrays, compiled on first use
+        # and cached on disk. Other inputs, or a missing Numba, go through sort().
+        data = self.data
+        if njit is None or not isinstance(data, np.ndarray):
+            return self.sort()
+        if data.ndim != 1 or data.dtype.kind not in "iuf":
+            return self.sort()
+        a = data.copy()
+        if len(a) > 1:
+            _quicksort_nb(a, 0, len(a) - 1)
+        return a.tolist()
+
+    def sort(self) -> List[T]:
+        data = self.data
+        if np is not None:
+            result = _numpy_sort(data)
+            if result is not None:
+                return result
+        if len(data) > _TIMSORT_THRESHOLD:
+            return self.sort_fast()
+        # Iterative in-place introsort on a copy of the data: quicksort over an
+        # explicit stack of (lo, hi, depth) ranges, heapsort once a range is
+        # 2*log2(n) partitions deep, insertion sort for short ranges.
+        a = list(data)
+        n = len(a)
+        insertion_sort = _insertion_sort
+        if n <= _INSERTION_THRESHOLD:
+            # Short inputs skip the partition machinery entirely
+            insertion_sort(a, 0, n - 1)
+            return a
+        # Bind loop invariants to locals
+        threshold = _INSERTION_THRESHOLD
+        heapsort = _heapsort
+        partition = _partition
+        stack = [(0, n - 1, 2 * int(log2(n)))]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            lo, hi, depth = pop()
+            if hi - lo < threshold:
+                insertion_sort(a, lo, hi)
+            elif depth == 0:
+                heapsort(a, lo, hi)
+            else:
+                p = partition(a, lo, hi)
+                depth -= 1
+                # Push the larger side first so the stack stays O(log n) deep
+                if p - lo > hi - p:
+                    push((lo, p, depth))
+                    push((p + 1, hi, depth))
+                else:
+                    push((p + 1, hi, depth))
+                    push((lo, p, depth))
+        return a
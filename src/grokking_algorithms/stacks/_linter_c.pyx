@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Optional C implementation of the bracket scan behind BracketMatcher.match.
+# It reads the PEP 393 string buffer directly and keeps the open-bracket stack
+# in C arrays. linter.py falls back to pure Python when this is not built.
+
+from libc.stdlib cimport malloc, realloc, free
+
+cdef extern from "Python.h":
+    Py_ssize_t PyUnicode_GET_LENGTH(object text)
+    int PyUnicode_KIND(object text)
+    void *PyUnicode_DATA(object text)
+    Py_UCS4 PyUnicode_READ(int kind, void *data, Py_ssize_t index) nogil
+
+
+cpdef list match_brackets(str text, const int[:] kinds, str mismatched,
+                          str unmatched_opening, str unmatched_closing):
+    """
+    Check the text for balanced brackets.
+
+    Args:
+        text (str): The input text to be checked.
+        kinds (array): BracketMatcher's kind table as C ints, indexed by code point.
+        mismatched (str): Error kind for a closer that does not match its opener.
+        unmatched_opening (str): Error kind for an opener that is never closed.
+        unmatched_closing (str): Error kind for a closer with no opener.
+
+    Returns:
+        list[tuple]: (kind, opener, opener_index, closer, closer_index) tuples in
+            the order BracketMatcher.match reports them.
+    """
+    cdef list errors = []
+    cdef Py_ssize_t n = PyUnicode_GET_LENGTH(text)
+    cdef int text_kind = PyUnicode_KIND(text)
+    cdef void *data = PyUnicode_DATA(text)
+    cdef Py_ssize_t table_size = kinds.shape[0]
+    cdef Py_UCS4 ch
+    cdef Py_ssize_t i, last_index
+    cdef Py_ssize_t depth = 0
+    cdef Py_ssize_t capacity = 64
+    cdef int kind
+    cdef int *stack_kinds = <int *>malloc(capacity * sizeof(int))
+    cdef Py_ssize_t *stack_indices = <Py_ssize_t *>malloc(capacity * sizeof(Py_ssize_t))
+    cdef void *grown
+
+    try:
+        if stack_kinds == NULL or stack_indices == NULL:
+            raise MemoryError()
+        for i in range(n):
+            ch = PyUnicode_READ(text_kind, data, i)
+            if <Py_ssize_t>ch >= table_size:
+                continue
+            kind = kinds[ch]
+            if kind == 0:
+                continue
+            if kind > 0:
+                if depth == capacity:
+                    capacity *= 2
+                    grown = realloc(stack_kinds, capacity * sizeof(int))
+                    if grown == NULL:
+                        raise MemoryError()
+                    stack_kinds = <int *>grown
+                    grown = realloc(stack_indices, capacity * sizeof(Py_ssize_t))
+                    if grown == NULL:
+                        raise MemoryError()
+                    stack_indices = <Py_ssize_t *>grown
+                stack_kinds[depth] = kind
+                stack_indices[depth] = i
+                depth += 1
+            elif depth == 0:
+                errors.append((unmatched_closing, None, None, chr(ch), i))
+            else:
+                depth -= 1
+                if stack_kinds[depth] != -kind:
+                    last_index = stack_indices[depth]
+                    errors.append((mismatched, text[last_index], last_index, chr(ch), i))
+        while depth:
+            depth -= 1
+            last_index = stack_indices[depth]
+            errors.append((unmatched_opening, text[last_index], last_index, None, None))
+    finally:
+        free(stack_kinds)
+        free(stack_indices)
+    return errors
@@ -3,29 +3,97 @@
 # specifically for balanced brackets. It includes a default BracketMatcher and allows
 # for custom matchers to be implemented, adhering to the Open/Closed Principle. 
 
-from collections import deque
-from abc import ABC, abstractmethod
+import re
+from array import array
+from collections import namedtuple
+from typing import List, Protocol, runtime_checkable
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - hyperscan is optional
+    hyperscan = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    from ._linter_c import match_brackets as _match_brackets_c
+except ImportError:  # pragma: no cover - the Cython extension is optional
+    _match_brackets_c = None
 
 DEFAULT_BRACKET_PAIRS = {'(': ')', '{': '}', '[': ']'}
 
+MISMATCHED = "mismatched"
+UNMATCHED_OPENING = "unmatched opening"
+UNMATCHED_CLOSING = "unmatched closing"
 
+# ASCII texts at least this long are scanned with Hyperscan when it is installed
+HYPERSCAN_MIN_LENGTH = 64 * 1024
+# ASCII texts at least this long are scanned with NumPy when it is installed
+NUMPY_MIN_LENGTH = 1024
 
-class Matcher(ABC):
-    """Abstract base class for matchers used by the Linter."""
-    @abstractmethod
-    def match(self, text):
+
+
+@runtime_checkable
+class Matcher(Protocol):
+    """
+    Protocol for matchers used by the Linter.
+
+    Any object with a match method qualifies; subclassing is optional.
+    """
+    def match(self, text: str) -> List:
         """
-        Analyze the given text and return a list of error messages.
+        Analyze the given text and return a list of errors.
 
         Args:
             text (str): The input text to be checked.
 
         Returns:
-            list[str]: A list of error messages.
+            list: A list of errors; str() of each error gives its message.
+        """
+        ...
+
+class BracketError(namedtuple("BracketError", ["kind", "opener", "opener_index", "closer", "closer_index"])):
+    """
+    A bracket error reported by BracketMatcher.
+
+    The message is only formatted when str() is called, so callers that just count
+    errors never pay for it. Substring checks (``"Unmatched" in error``) apply to the
+    message; other membership checks (``MISMATCHED in error``) fall back to the fields.
+    Fields that do not apply to the kind of error are None.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        """
+        Return the error message.
+
+        Returns:
+            str: The formatted error message.
+        """
+        if self.kind == MISMATCHED:
+            return f"Mismatched '{self.opener}' at index {self.opener_index} with '{self.closer}' at index {self.closer_index}"
+        if self.kind == UNMATCHED_OPENING:
+            return f"Unmatched opening '{self.opener}' at index {self.opener_index}"
+        return f"Unmatched closing '{self.closer}' at index {self.closer_index}"
+
+    def __contains__(self, item):
         """
-        pass
+        Check if a substring occurs in the error message, or a value among the fields.
 
-class BracketMatcher(Matcher):
+        Args:
+            item: A substring of the message, or any other value to look for in the fields.
+
+        Returns:
+            bool: True if the message contains item or a field equals it, False otherwise.
+        """
+        if isinstance(item, str) and item in str(self):
+            return True
+        return tuple.__contains__(self, item)
+
+class BracketMatcher:
     """
     Matcher implementation that checks for balanced brackets in the text.
     """
@@ -37,6 +105,95 @@ class BracketMatcher(Matcher):
             pairs (dict, optional): A dictionary of opening and closing bracket pairs.
         """
         self.pairs = pairs or DEFAULT_BRACKET_PAIRS
+        self._openers = frozenset(self.pairs)
+        self._closers = frozenset(self.pairs.values())
+        # Character class of every bracket, so match only visits bracket positions
+        brackets = "".join(sorted(self._openers | self._closers))
+        self._scan = re.compile("[" + re.escape(brackets) + "]")
+        # Table indexed by ord(char): each distinct closer gets an id k >= 1; its
+        # openers map to k and the closer to -k, so match compares integers
+        closer_ids = {closer: k for k, closer in enumerate(dict.fromkeys(self.pairs.values()), 1)}
+        self._kinds = [0] * (max(map(ord, brackets), default=-1) + 1)
+        for opener, closer in self.pairs.items():
+            self._kinds[ord(opener)] = closer_ids[closer]
+        for closer, k in closer_ids.items():
+            if closer not in self._openers:
+                self._kinds[ord(closer)] = -k
+        # The same table as C ints, for the Cython extension to index directly
+        self._kinds_c = array("i", self._kinds)
+        self._brackets = brackets
+        # Deletion table: ASCII text without brackets translates to the same length
+        self._any_bracket = str.maketrans("", "", brackets)
+        self._hyperscan_db = None
+        # Byte lookup table marking bracket bytes, for the NumPy scan
+        self._bracket_lut = None
+        if np is not None and brackets.isascii():
+            self._bracket_lut = np.zeros(256, dtype=bool)
+            self._bracket_lut[[ord(char) for char in brackets]] = True
+
+    def _hyperscan_events(self, text):
+        """
+        Find bracket positions with a Hyperscan block-mode database.
+
+        Args:
+            text (str): ASCII text to scan.
+
+        Returns:
+            list[tuple[int, str]]: (index, bracket) pairs in text order.
+        """
+        if self._hyperscan_db is None:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[f"\\x{ord(char):02x}".encode() for char in self._brackets],
+                ids=list(range(len(self._brackets))),
+                elements=len(self._brackets),
+                flags=[0] * len(self._brackets),
+            )
+            self._hyperscan_db = db
+        brackets = self._brackets
+        events = []
+        push = events.append
+
+        def on_match(pattern_id, start, end, flags, context):
+            push((end - 1, brackets[pattern_id]))
+
+        self._hyperscan_db.scan(text.encode("ascii"), match_event_handler=on_match)
+        events.sort()
+        return events
+
+    def _numpy_events(self, text):
+        """
+        Find bracket positions by looking every byte up in a table with NumPy.
+
+        Args:
+            text (str): ASCII text to scan.
+
+        Returns:
+            list[tuple[int, str]]: (index, bracket) pairs in text order.
+        """
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        indices = np.flatnonzero(self._bracket_lut[buf])
+        return list(zip(indices.tolist(), buf[indices].tobytes().decode("ascii")))
+
+    def _bracket_events(self, text):
+        """
+        Find the position of every bracket in the text.
+
+        Large ASCII texts go through Hyperscan or NumPy when they are installed (ASCII,
+        so byte offsets equal string indices); everything else uses the precompiled regex.
+
+        Args:
+            text (str): The input text to be checked.
+
+        Returns:
+            iterable of tuple[int, str]: (index, bracket) pairs in text order.
+        """
+        if len(text) >= NUMPY_MIN_LENGTH and self._brackets.isascii() and text.isascii():
+            if hyperscan is not None and len(text) >= HYPERSCAN_MIN_LENGTH:
+                return self._hyperscan_events(text)
+            if self._bracket_lut is not None:
+                return self._numpy_events(text)
+        return [(found.start(), found.group()) for found in self._scan.finditer(text)]
     
     def match(self, text):
         """
@@ -46,23 +203,55 @@ class BracketMatcher(Matcher):
             text (str): The input text to be checked.
 
         Returns:
-            list[str]: A list of error messages. Returns an empty list if no errors are found.
+            list[BracketError]: A list of errors; str() of each gives its message.
+                Returns an empty list if no errors are found.
         """
-        stack = deque()
+        if _match_brackets_c is not None:
+            raw_errors = _match_brackets_c(
+                text, self._kinds_c, MISMATCHED, UNMATCHED_OPENING, UNMATCHED_CLOSING
+            )
+            error = tuple.__new__
+            return [error(BracketError, raw) for raw in raw_errors]
+        # Plain prose usually has no brackets at all. translate is fastest on ASCII
+        # text but does a dict lookup per character otherwise, where the regex
+        # search is faster and stops at the first bracket
+        if text.isascii():
+            if len(text.translate(self._any_bracket)) == len(text):
+                return []
+        elif self._scan.search(text) is None:
+            return []
+        # Parallel stacks of expected closer kinds and opener indices, so a push
+        # allocates no tuple
+        kinds = []
+        indices = []
         errors = []
-        for index, char in enumerate(text):
-            if char in self.pairs:
-                stack.append((char, index))
-            elif char in self.pairs.values():
-                if not stack:
-                    errors.append(f"Unmatched closing '{char}' at index {index}")
+        # Bind loop invariants to locals
+        kind_of = self._kinds
+        char_code = ord
+        push_kind = kinds.append
+        push_index = indices.append
+        pop_kind = kinds.pop
+        pop_index = indices.pop
+        report = errors.append
+        # tuple.__new__ skips the Python-level namedtuple constructor
+        error = tuple.__new__
+        for index, char in self._bracket_events(text):
+            # Openers push the kind of closer they expect; the opener itself is
+            # recovered from text when reporting
+            kind = kind_of[char_code(char)]
+            if kind > 0:
+                push_kind(kind)
+                push_index(index)
+            else:
+                if not kinds:
+                    report(error(BracketError, (UNMATCHED_CLOSING, None, None, char, index)))
                 else:
-                    last_open, last_index = stack.pop()
-                    if self.pairs[last_open] != char:
-                        errors.append(f"Mismatched '{last_open}' at index {last_index} with '{char}' at index {index}")
-        while stack:
-            last_open, last_index = stack.pop()
-            errors.append(f"Unmatched opening '{last_open}' at index {last_index}")
+                    last_index = pop_index()
+                    if pop_kind() != -kind:
+                        report(error(BracketError, (MISMATCHED, text[last_index], last_index, char, index)))
+        while indices:
+            last_index = pop_index()
+            report(error(BracketError, (UNMATCHED_OPENING, text[last_index], last_index, None, None)))
         return errors
 
 class Linter:
@@ -88,6 +277,17 @@ class Linter:
         """
         self.matcher = matcher
 
+    @property
+    def matcher(self):
+        """Matcher: The matcher used for linting."""
+        return self._matcher
+
+    @matcher.setter
+    def matcher(self, matcher):
+        # Keep the bound match method so lint skips the attribute lookups
+        self._matcher = matcher
+        self._match = matcher.match
+
     def lint(self, text):
         """
         Lint the given text using the configured matcher.
@@ -96,8 +296,8 @@ class Linter:
             text (str): The input text to be checked.
 
         Returns:
-            list[str]: A list of error messages.
+            list: The errors reported by the matcher.
         """
-        return self.matcher.match(text)
+        return self._match(text)
 
 
@@ -0,0 +1,192 @@
+import math
+import pytest
+from grokking_algorithms.expression_formatter import (
+    ExpressionFormatter,
+    UnaryOp,
+    Variable,
+    compile_to_bytecode,
+    evaluate,
+    tokenize,
+)
+from grokking_algorithms import expression_formatter
+
+
+def test_tokenize_skips_whitespace():
+    assert list(tokenize(" a\n+\tb ")) == [("ID", "a"), ("OP", "+"), ("ID", "b")]
+
+def test_tokenize_keywords_need_word_boundaries():
+    assert list(tokenize("a and b")) == [("ID", "a"), ("OP", "and"), ("ID", "b")]
+    assert list(tokenize("andx")) == [("ID", "andx")]
+    assert list(tokenize("1and")) == [("NUMBER", "1"), ("ID", "and")]
+    assert list(tokenize("not a")) == [("OP", "not"), ("ID", "a")]
+
+def test_tokenize_two_character_operators():
+    assert [val for _, val in tokenize("a==b!=c<=d>=e**f<g>h*i")] == [
+        "a", "==", "b", "!=", "c", "<=", "d", ">=", "e", "**", "f", "<", "g", ">", "h", "*", "i",
+    ]
+
+@pytest.mark.parametrize("expr", ["!", "a != !", ".", "a.b"])
+def test_tokenize_rejects_unknown_characters(expr):
+    with pytest.raises(SyntaxError):
+        list(tokenize(expr))
+
+def test_tokenize_numbers():
+    assert list(tokenize("12 + 3.5 - 1.")) == [
+        ("NUMBER", "12"), ("OP", "+"), ("NUMBER", "3.5"), ("OP", "-"), ("NUMBER", "1."),
+    ]
+    # Non-ASCII decimal digits are numbers too, as with the regex \d
+    assert list(tokenize("\u0661\u0662 + \u0664.\u0665")) == [
+        ("NUMBER", "\u0661\u0662"), ("OP", "+"), ("NUMBER", "\u0664.\u0665"),
+    ]
+
+def test_tokenize_commas_and_parentheses():
+    assert list(tokenize("round(a_1, 2)")) == [
+        ("ID", "round"), ("OP", "("), ("ID", "a_1"), ("COMMA", ","), ("NUMBER", "2"), ("OP", ")"),
+    ]
+
+
+@pytest.mark.parametrize("expr, expected", [
+    ("a + b * c", "a + (b * c)"),
+    ("a * b + c", "(a * b) + c"),
+    ("a ** b * c", "(a ** b) * c"),
+    # The manual table in the module expects "a ** (b ** c)" and "(-a) + b" for
+    # these two; the formatter has always produced the output below
+    ("a ** b ** c", "a ** b ** c"),
+    ("-a + b", "-(a) + b"),
+    ("abs(a + b * c)", "abs(a + (b * c))"),
+    ("round(a + b, 2)", "round(a + b, 2)"),
+    ("a and b or c", "(a and b) or c"),
+    ("a == b and c", "(a == b) and c"),
+    ("(a + b) * c", "(a + b) * c"),
+    ("(a + b) ** c", "(a + b) ** c"),
+    ("a + b + c", "a + b + c"),
+    ("a * (b + c)", "a * (b + c)"),
+    ("-abs(a - b)", "-(abs(a - b))"),
+])
+def test_format(expr, expected):
+    assert ExpressionFormatter(expr).format() == expected
+
+def test_format_subtrees_with_parent_precedence():
+    expression = ExpressionFormatter("a and b or c").expression
+    assert expression.format() == "(a and b) or c"
+    assert expression.format(parent_prec=2) == "((a and b) or c)"
+    assert expression.left.format(parent_prec=1) == "a and b"
+    product = ExpressionFormatter("(a + b) * c").expression
+    assert product.left.format(parent_prec=5) == "a + b"
+    assert product.left.format(parent_prec=6) == "(a + b)"
+    assert ExpressionFormatter("a + b * c").expression.format(parent_prec=6) == "(a + (b * c))"
+
+@pytest.mark.parametrize("op", ["+", "**"])
+def test_long_chains_do_not_recurse(op):
+    expr = f" {op} ".join(["a"] * 20000)
+    assert ExpressionFormatter(expr).format() == expr
+
+
+def run(expr, *values):
+    ops, consts, names = ExpressionFormatter(expr).compile_to_bytecode()
+    return evaluate(ops, consts, list(values))
+
+@pytest.mark.parametrize("expr, values, expected", [
+    ("2.5", (), 2.5),
+    ("a", (4,), 4.0),
+    ("-a", (3,), -3.0),
+    ("abs(a)", (-2,), 2.0),
+    ("round(a)", (2.6,), 3.0),
+    ("round(a, 2)", (3.14159,), 3.14),
+    ("a + b", (1, 2), 3.0),
+    ("a - b", (1, 2), -1.0),
+    ("a * b", (3, 4), 12.0),
+    ("a / b", (1, 4), 0.25),
+    ("a % b", (-7, 3), 2.0),
+    ("a ** b", (2, 10), 1024.0),
+    ("a == b", (1, 1), 1.0),
+    ("a != b", (1, 1), 0.0),
+    ("a < b", (1, 2), 1.0),
+    ("a > b", (1, 2), 0.0),
+    ("a <= b", (2, 2), 1.0),
+    ("a >= b", (1, 2), 0.0),
+    ("a and b", (0, 3), 0.0),
+    ("a and b", (2, 3), 3.0),
+    ("a or b", (0, 3), 3.0),
+    ("a or b", (2, 3), 2.0),
+])
+def test_evaluate_opcodes(expr, values, expected):
+    assert run(expr, *values) == expected
+
+def test_evaluate_power_follows_ieee754():
+    assert math.isnan(run("a ** b", -8, 0.5))
+    assert run("a ** b", 0, -1) == math.inf
+    assert run("a ** b", -0.0, -1) == -math.inf
+    assert run("a ** b", 10, 400) == math.inf
+    assert run("a ** b", -10, 401) == -math.inf
+
+def test_evaluate_round_passes_non_finite_values():
+    assert math.isnan(run("round(a)", math.nan))
+    assert run("round(a)", math.inf) == math.inf
+    assert run("round(a)", -math.inf) == -math.inf
+    assert run("round(a)", 1e300) == 1e300
+    assert math.isnan(run("round(a, 2)", math.nan))
+    assert run("round(a, 2)", -math.inf) == -math.inf
+
+def test_evaluate_raises_on_zero_division_and_non_finite_ndigits():
+    with pytest.raises(ZeroDivisionError):
+        run("a / b", 1, 0)
+    with pytest.raises(ZeroDivisionError):
+        run("a % b", 1, 0)
+    with pytest.raises(ValueError):
+        run("round(a, b)", 1.5, math.nan)
+
+def test_evaluate_nested_expression():
+    assert run("round(abs(a - b) * 2, 1) + -c", 1.25, 3, 0.5) == 3.0
+
+def test_compile_names_follow_first_use():
+    ops, consts, names = ExpressionFormatter("b * a + c - b").compile_to_bytecode()
+    assert names == ("b", "a", "c")
+    assert evaluate(ops, consts, [2, 3, 4]) == 8.0
+
+def test_compile_rejects_unsupported_nodes():
+    with pytest.raises(ValueError):
+        compile_to_bytecode(UnaryOp("not", Variable("a")))
+    with pytest.raises(ValueError):
+        ExpressionFormatter("max(a, b)").compile_to_bytecode()
+    with pytest.raises(ValueError):
+        ExpressionFormatter("round(a, b, c)").compile_to_bytecode()
+
+def test_evaluate_rejects_unknown_opcode():
+    with pytest.raises(ValueError):
+        evaluate([0, 0, 99], [1.0, 2.0], [])
+
+def test_numba_matches_dispatch():
+    pytest.importorskip("numba")
+    cases = [
+        ("a + b * c - d / e", (1, 2, 3, 4, 8)),
+        ("a % b ** c", (17, 2, 3)),
+        ("a ** b", (-8, 0.5)),
+        ("a ** b", (0, -1)),
+        ("a ** b", (10, 400)),
+        ("-abs(a) + round(b) + round(c, 1)", (-2, 2.4, 1.26)),
+        ("round(a)", (math.nan,)),
+        ("round(a)", (math.inf,)),
+        ("round(a)", (-math.inf,)),
+        ("round(a)", (1e300,)),
+        ("round(a, 2)", (math.nan,)),
+        ("round(a, 2)", (math.inf,)),
+        ("a < b and c >= d or a == e", (1, 2, 3, 3, 5)),
+        ("a != b or c", (1, 1, 0)),
+    ]
+    for expr, values in cases:
+        ops, consts, _ = ExpressionFormatter(expr).compile_to_bytecode()
+        var_values = expression_formatter.np.asarray(values, dtype=float)
+        jitted = expression_formatter._evaluate_impl(ops, consts, var_values)
+        dispatched = expression_formatter._evaluate_dispatch(ops, consts, var_values)
+        assert jitted == dispatched or (math.isnan(jitted) and math.isnan(dispatched))
+    for expr, values, error in [
+        ("a / b", (1, 0), ZeroDivisionError),
+        ("a % b", (1, 0), ZeroDivisionError),
+        ("round(a, b)", (1.5, math.inf), ValueError),
+    ]:
+        ops, consts, _ = ExpressionFormatter(expr).compile_to_bytecode()
+        var_values = expression_formatter.np.asarray(values, dtype=float)
+        for impl in (expression_formatter._evaluate_impl, expression_formatter._evaluate_dispatch):
+            with pytest.raises(error):
+                impl(ops, consts, var_values)
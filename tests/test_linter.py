@@ -1,5 +1,8 @@
+import random
+import types
 import pytest
-from grokking_algorithms.stacks.linter import Linter, BracketMatcher, Matcher
+from grokking_algorithms.stacks import linter as linter_module
+from grokking_algorithms.stacks.linter import Linter, BracketMatcher, Matcher, BracketError, MISMATCHED, UNMATCHED_OPENING, UNMATCHED_CLOSING
 
 @pytest.fixture
 def linter():
@@ -59,4 +62,77 @@ class DummyMatcher(Matcher):
 def test_custom_matcher():
     linter = Linter(DummyMatcher())
     result = linter.lint("any text")
-    assert result == ["Dummy matcher always returns this"]
\ No newline at end of file
+    assert result == ["Dummy matcher always returns this"]
+
+def test_bracket_errors_format_lazily():
+    errors = BracketMatcher().match("[a + b) (")
+    assert errors == [
+        BracketError(MISMATCHED, "[", 0, ")", 6),
+        BracketError(UNMATCHED_OPENING, "(", 8, None, None),
+    ]
+    assert str(errors[0]) == "Mismatched '[' at index 0 with ')' at index 6"
+    assert str(errors[1]) == "Unmatched opening '(' at index 8"
+    assert str(BracketMatcher().match("]")[0]) == "Unmatched closing ']' at index 0"
+
+def test_long_text_errors_keep_their_indices():
+    chunk = "f(a[i]) } "
+    text = chunk * 200
+    errors = BracketMatcher().match(text)
+    assert len(errors) == 200
+    assert errors[-1] == BracketError(UNMATCHED_CLOSING, None, None, "}", len(text) - 2)
+
+def test_matcher_is_structural():
+    class DuckMatcher:
+        def match(self, text):
+            return []
+
+    assert isinstance(BracketMatcher(), Matcher)
+    assert isinstance(DuckMatcher(), Matcher)
+    assert not isinstance(object(), Matcher)
+    assert Linter(DuckMatcher()).lint("(") == []
+
+def test_replacing_matcher_updates_lint():
+    linter = Linter(BracketMatcher())
+    linter.matcher = DummyMatcher()
+    assert linter.lint("(") == ["Dummy matcher always returns this"]
+
+def test_text_without_brackets(linter):
+    assert linter.lint("plain prose, no brackets here\n" * 100) == []
+
+def test_c_extension_matches_python(monkeypatch):
+    _linter_c = pytest.importorskip("grokking_algorithms.stacks._linter_c")
+    random.seed(7)
+    matchers = [
+        BracketMatcher(),
+        BracketMatcher({"(": ")", "<": ">", "[": ")"}),
+        BracketMatcher(types.MappingProxyType({"\u00e9": "\u00fc", "|": "|"})),
+    ]
+    texts = ["".join(random.choice("(){}[]<>|\u00e9\u00fc\u4e2d ab\n") for _ in range(n))
+             for n in (0, 1, 5, 40, 300, 5000) for _ in range(20)]
+    assert linter_module._match_brackets_c is _linter_c.match_brackets
+    expected = []
+    with monkeypatch.context() as patch:
+        patch.setattr(linter_module, "_match_brackets_c", None)
+        for matcher in matchers:
+            expected.extend(matcher.match(text) for text in texts)
+    got = []
+    for matcher in matchers:
+        got.extend(matcher.match(text) for text in texts)
+    assert got == expected
+
+def test_bracket_error_membership():
+    error = BracketMatcher().match("(]")[0]
+    assert "Mismatched" in error
+    assert MISMATCHED in error
+    assert ")" not in error
+    assert 1 in error
+    assert None not in error
+    assert 5 not in error
+    unmatched = BracketMatcher().match("(")[0]
+    assert None in unmatched
+
+def test_non_ascii_text_with_and_without_brackets(linter):
+    assert linter.lint("straße café 日本語 текст\n" * 100) == []
+    errors = linter.lint("日本語 f(x] текст" * 3)
+    assert [error.kind for error in errors] == [MISMATCHED] * 3
+    assert errors[0] == BracketError(MISMATCHED, "(", 5, "]", 7)
@@ -56,6 +56,41 @@ def test_len_and_size():
     assert len(sll) == 5
     assert sll.size() == 5
 
+def test_len_tracks_inserts_and_deletes():
+    sll = SingleLinkedList()
+    assert len(sll) == 0
+    assert not sll
+    sll.insert_to_front(1)
+    sll.insert_to_back(2)
+    assert len(sll) == 2
+    sll.delete(1)
+    assert len(sll) == 1
+    sll.delete_from_front()
+    assert len(sll) == 0
+    assert sll.size() == 0
+    with pytest.raises(ValueError):
+        sll.delete(1)
+    with pytest.raises(ValueError):
+        sll.delete_from_front()
+    assert len(sll) == 0
+
+def test_insert_to_back_after_deleting_tail():
+    sll = SingleLinkedList()
+    for i in [1, 2, 3]:
+        sll.insert_to_back(i)
+    sll.delete(3)
+    sll.insert_to_back(4)
+    assert list(sll) == [1, 2, 4]
+    sll.delete_from_front()
+    sll.delete_from_front()
+    sll.delete_from_front()
+    sll.insert_to_back(5)
+    assert list(sll) == [5]
+    sll.delete(5)
+    sll.insert_to_front(6)
+    sll.insert_to_back(7)
+    assert list(sll) == [6, 7]
+
 def test_search_and_contains():
     sll = SingleLinkedList()
     for i in [10, 20, 30]:
@@ -76,6 +111,18 @@ def test_get_valid_and_invalid():
     with pytest.raises(IndexError):
         sll.get(3)
 
+def test_get_returns_stored_object_and_get_copy_is_independent():
+    sll = SingleLinkedList()
+    payload = {"values": [1, 2]}
+    sll.insert_to_back(payload)
+    assert sll.get(0) is payload
+    copied = sll.get_copy(0)
+    assert copied == payload
+    copied["values"].append(3)
+    assert payload == {"values": [1, 2]}
+    with pytest.raises(IndexError):
+        sll.get_copy(1)
+
 def test_delete_existing_and_not_found():
     sll = SingleLinkedList()
     for i in [1, 2, 3, 2]:
@@ -1,5 +1,6 @@
+import random
 import pytest
-from grokking_algorithms.sorting import RecursiveQuickSort
+from grokking_algorithms.sorting import RecursiveQuickSort, _heapsort, _partition, _pivot
 
 def test_recursive_quick_sort_empty_list():
     sorter = RecursiveQuickSort([])
@@ -23,4 +24,68 @@ def test_recursive_quick_sort_unsorted_list():
 
 def test_recursive_quick_sort_with_duplicates():
     sorter = RecursiveQuickSort([4, 2, 4, 3, 1, 2, 4])
-    assert sorter.sort() == [1, 2, 2, 3, 4, 4, 4]
\ No newline at end of file
+    assert sorter.sort() == [1, 2, 2, 3, 4, 4, 4]
+
+def test_recursive_quick_sort_large_inputs():
+    rng = random.Random(0)
+    cases = [
+        list(range(1000)),
+        list(range(1000, 0, -1)),
+        [rng.randint(0, 5) for _ in range(1000)],
+        [rng.random() for _ in range(1000)],
+    ]
+    for data in cases:
+        assert RecursiveQuickSort(data).sort() == sorted(data)
+        # Short enough to stay on the introsort path
+        assert RecursiveQuickSort(data[:64]).sort() == sorted(data[:64])
+
+def test_recursive_quick_sort_does_not_modify_input():
+    data = [3, 1, 2]
+    assert RecursiveQuickSort(data).sort() == [1, 2, 3]
+    assert data == [3, 1, 2]
+
+def test_sort_fast_matches_sort():
+    data = [5, 3, 8, 1, 9, 2]
+    sorter = RecursiveQuickSort(data)
+    assert sorter.sort_fast() == sorter.sort() == [1, 2, 3, 5, 8, 9]
+
+def test_numpy_inputs():
+    np = pytest.importorskip("numpy")
+    ints = list(range(200, 0, -1))
+    floats = [x / 3 for x in ints]
+    assert RecursiveQuickSort(ints).sort() == sorted(ints)
+    assert RecursiveQuickSort(floats).sort() == sorted(floats)
+    assert RecursiveQuickSort(np.array([3, 1, 2])).sort() == [1, 2, 3]
+    mixed = ints + [0.5]
+    assert RecursiveQuickSort(mixed).sort() == sorted(mixed)
+
+def test_sort_jit():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    for data in (rng.random(1000), rng.integers(0, 10, 1000), np.arange(500)[::-1]):
+        assert RecursiveQuickSort(data).sort_jit() == sorted(data.tolist())
+    assert RecursiveQuickSort([3, 1, 2]).sort_jit() == [1, 2, 3]
+
+def test_heapsort_sorts_only_the_subrange():
+    random.seed(5)
+    data = [random.randint(-50, 50) for _ in range(100)]
+    a = list(data)
+    _heapsort(a, 20, 79)
+    assert a[:20] == data[:20]
+    assert a[80:] == data[80:]
+    assert a[20:80] == sorted(data[20:80])
+
+def test_ninther_pivot_and_partition_on_long_ranges():
+    assert _pivot(list(range(1000)), 0, 999) == 499
+    random.seed(6)
+    for lo, hi in [(0, 255), (0, 999), (100, 499)]:
+        data = [random.randint(0, 300) for _ in range(1000)]
+        a = list(data)
+        p = _pivot(a, lo, hi)
+        assert lo <= p <= hi
+        j = _partition(a, lo, hi)
+        assert lo <= j < hi
+        assert max(a[lo:j + 1]) <= min(a[j + 1:hi + 1])
+        assert sorted(a[lo:hi + 1]) == sorted(data[lo:hi + 1])
+        assert a[:lo] == data[:lo] and a[hi + 1:] == data[hi + 1:]